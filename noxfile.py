@@ -1,6 +1,4 @@
-import os
 from pathlib import Path
-import tempfile
 from typing import Any
 
 import nox
@@ -51,7 +49,16 @@ def xdoctest(session: Session) -> None:
 def install_with_constraints(
     session: Session, *args: str, **kwargs: Any  # noqa: ANN401
 ) -> None:
-    with tempfile.NamedTemporaryFile(delete=False) as requirements:
+    # `poetry export` takes a couple of seconds, and every session used to pay
+    # for it with a fresh tempfile. Export once into a cache file under .nox
+    # and reuse it until poetry.lock changes out from under it.
+    requirements = Path(".nox") / ".cache" / "requirements.txt"
+    lock_file = Path("poetry.lock")
+    if (
+        not requirements.exists()
+        or requirements.stat().st_mtime < lock_file.stat().st_mtime
+    ):
+        requirements.parent.mkdir(parents=True, exist_ok=True)
         session.run(
             "poetry",
             "export",
@@ -59,9 +66,8 @@ def install_with_constraints(
             "dev",
             "--without-hashes",
             "--format=requirements.txt",
-            f"--output={requirements.name}",
+            f"--output={requirements}",
             external=True,
         )
-        session.install(f"--constraint={requirements.name}", *args, **kwargs)
 
-    os.unlink(requirements.name)
+    session.install(f"--constraint={requirements}", *args, **kwargs)
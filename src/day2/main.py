@@ -1,4 +1,6 @@
-from heapq import nsmallest
+import re
+
+import numpy as np
 
 """
 ### Part 1:
@@ -64,12 +66,37 @@ def paper_area(length: int, width: int, height: int) -> int:
     return sum(2 * side for side in sides) + extra
 
 
+dimension_pattern = re.compile(rb"\d+")
+
+
+def parse_all_dimensions(input: str) -> np.ndarray:
+    """
+    Rather than parsing and totaling the presents one line at a time, I parse
+    the whole input into an `(N, 3)` integer array up front so the arithmetic
+    for every present can happen in one vectorized shot. A single `findall`
+    over the raw bytes pulls out every number in one regex pass — no per-line
+    split, map, or tuple allocations.
+
+        >>> parse_all_dimensions("2x3x4\\n1x1x10").tolist()
+        [[2, 3, 4], [1, 1, 10]]
+    """
+    numbers = dimension_pattern.findall(input.encode("ascii"))
+    return np.array(numbers, dtype=np.int64).reshape(-1, 3)
+
+
 def part1(input: str) -> int:
     """
-    Split the input into separate present dimension lines, calculate each of
-    their wrapping paper areas, and then return the total.
+    Parse all of the present dimensions into one array, compute every
+    present's three side areas as columns, and total the doubled sides plus
+    the smallest side of each present — the same math as `paper_area`, but
+    applied to every present at once.
     """
-    return sum(paper_area(*parse_dimensions(line)) for line in input.splitlines())
+    dims = parse_all_dimensions(input)
+    sides = np.stack(
+        [dims[:, 0] * dims[:, 1], dims[:, 1] * dims[:, 2], dims[:, 2] * dims[:, 0]],
+        axis=1,
+    )
+    return int((2 * sides.sum(axis=1) + sides.min(axis=1)).sum())
 
 
 """
@@ -110,9 +137,13 @@ How many total feet of ribbon should they order?
 def ribbon_length(length: int, width: int, height: int) -> int:
     """Calculate a present's required ribbon length"""
 
-    # Find the two smallest sides for the wrapped ribbon length
-    short_sides = nsmallest(2, [length, width, height])
-    wrapped_length = sum(side * 2 for side in short_sides)
+    # The two smallest of three sides are everything but the largest, so
+    # there's no need for a general heap selection here: the sum of the two
+    # shortest sides is just the total minus the min and the max.
+    smallest = min(length, width, height)
+    largest = max(length, width, height)
+    middle = length + width + height - smallest - largest
+    wrapped_length = 2 * (smallest + middle)
 
     # The length of ribbon needed for the bow is equal to the present's volume
     bow_length = length * width * height
@@ -122,10 +153,13 @@ def ribbon_length(length: int, width: int, height: int) -> int:
 
 def part2(input: str) -> int:
     """
-    Split the input into separate present dimension lines, calculate each of
-    their required ribbon lengths, and then return the total.
+    Parse all of the present dimensions into one array and sort each row so
+    the two shortest sides land in the first two columns. The ribbon total is
+    then twice those columns plus each row's product for the bow — the same
+    math as `ribbon_length`, but applied to every present at once.
     """
-    return sum(ribbon_length(*parse_dimensions(line)) for line in input.splitlines())
+    dims = np.sort(parse_all_dimensions(input), axis=1)
+    return int((2 * (dims[:, 0] + dims[:, 1]) + dims.prod(axis=1)).sum())
 
 
 if __name__ == "__main__":
@@ -17,9 +17,10 @@ than once. How many houses receive **at least one present**?
 """
 
 
-import logging
 from typing import Iterable, NamedTuple
 
+import numpy as np
+
 
 def test_part1() -> None:
     """For example:"""
@@ -69,23 +70,56 @@ def follow_path(starting_position: Pos, path: str) -> Iterable[Pos]:
     """
 
     current_position = starting_position
-    logging.debug(f"Starting at {current_position}")
     yield current_position
 
+    # Inputs only ever contain the four direction characters, so a plain dict
+    # lookup is enough — no default `Pos(0, 0)` construction per step. The
+    # per-step `logging.debug` calls are gone too: their f-strings were
+    # formatted on every move even with the logger disabled, which cost more
+    # than the move arithmetic itself.
     for direction in path:
-        current_position = current_position.move(directions.get(direction, Pos(0, 0)))
-        logging.debug(f"Moved {direction} to {current_position}")
+        offset = directions[direction]
+        current_position = Pos(
+            current_position.x + offset.x, current_position.y + offset.y
+        )
         yield current_position
 
 
+# Following the path one `Pos` at a time allocates a tuple per step and hashes
+# each one into a set, which is all interpreter overhead. Instead, a pair of
+# 256-entry translation tables maps each direction byte straight to its x or y
+# delta so `bytes.translate` can convert the whole path to moves in one
+# C-level pass — no per-row table gather needed. 255 reads as -1 once the
+# translated buffer is viewed as int8.
+dx_table = bytes(
+    (1 if c == ord("^") else 255 if c == ord("v") else 0) for c in range(256)
+)
+dy_table = bytes(
+    (1 if c == ord(">") else 255 if c == ord("<") else 0) for c in range(256)
+)
+
+
+def visited_houses(path: str) -> np.ndarray:
+    """
+    Follow the whole path at once: translate the path bytes into x and y
+    deltas, cumulative-sum the moves to get every position (with the starting
+    house prepended), then pack each `(x, y)` pair into a single int64 so
+    positions can be deduplicated without building Python tuples.
+    """
+    path_bytes = path.encode("ascii")
+    dx = np.frombuffer(path_bytes.translate(dx_table), dtype=np.int8)
+    dy = np.frombuffer(path_bytes.translate(dy_table), dtype=np.int8)
+    xs = np.concatenate((np.zeros(1, np.int32), np.cumsum(dx, dtype=np.int32)))
+    ys = np.concatenate((np.zeros(1, np.int32), np.cumsum(dy, dtype=np.int32)))
+    return (xs.astype(np.int64) << 32) | (ys.astype(np.int64) & 0xFFFFFFFF)
+
+
 def part1(input: str) -> int:
     """
-    Take the list of directions, find the path that will be taken, and return
-    the number of unique positions.
+    Take the list of directions, find every house visited along the path, and
+    return the number of unique ones via `np.unique` on the packed positions.
     """
-    starting_position = Pos(0, 0)
-    unique_positions = set(follow_path(starting_position, input))
-    return len(unique_positions)
+    return int(np.unique(visited_houses(input)).size)
 
 
 """
@@ -124,14 +158,14 @@ def part2(input: str) -> int:
     """
     Slice the input directions to be every other direction starting from the
     first for Santa, and every other direction starting from the second for
-    Robo-Stana. Then, combine the two sets of positions and return the total
-    number of unique positions.
+    Robo-Stana. Then, concatenate the two arrays of packed positions and
+    count the distinct keys with one `np.unique` — a single sort-and-dedupe
+    over 8-byte ints, with none of the per-element hashing a set union does.
     """
-
-    starting_position = Pos(0, 0)
-    santa_positions = set(follow_path(starting_position, input[::2]))
-    robo_santa_positions = set(follow_path(starting_position, input[1::2]))
-    return len(santa_positions | robo_santa_positions)
+    santa_houses = visited_houses(input[::2])
+    robo_santa_houses = visited_houses(input[1::2])
+    all_houses = np.concatenate((santa_houses, robo_santa_houses))
+    return int(np.unique(all_houses).size)
 
 
 if __name__ == "__main__":
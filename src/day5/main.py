@@ -17,7 +17,10 @@ A **nice string** is one with all of the following properties:
 """
 
 
-import re
+from functools import lru_cache
+
+import numba
+import numpy as np
 
 
 def test_part1() -> None:
@@ -48,29 +51,66 @@ How many strings are nice?
 # === Part 1 Solution: ===
 
 
+@lru_cache
+def deletion_table(characters: str) -> dict[int, int | None]:
+    """
+    Build (and cache) a translation table that deletes every ASCII character
+    except the given ones.
+    """
+    doomed = "".join(chr(c) for c in range(128) if chr(c) not in characters)
+    return str.maketrans("", "", doomed)
+
+
 def letter_count(characters: str, test_string: str) -> int:
     """
     Returns the number of times one of the given characters is in the given test
-    string.
+    string. Counting each character separately would scan the string once per
+    character; deleting everything else with `str.translate` leaves only the
+    wanted characters behind, counting them all in a single C-level pass.
 
         >>> letter_count("aeiou", "abcdde")
         2
     """
-    return sum(test_string.count(char) for char in characters)
+    return len(test_string.translate(deletion_table(characters)))
+
+
+# All three rules can be decided in one left-to-right look at each character
+# and its predecessor, so rather than a translate pass for the vowels plus a
+# regex search for the doubles plus substring scans for the forbidden
+# bigrams, a single compiled loop over the encoded bytes settles everything.
+# The vowel flags live in a 256-entry table the kernel can index directly.
+vowel_flags = np.zeros(256, dtype=np.uint8)
+for vowel in b"aeiou":
+    vowel_flags[vowel] = 1
+
+
+@numba.njit
+def _scan_nice(b: np.ndarray) -> bool:
+    """
+    One pass deciding all three part 1 rules: count vowels, watch for a
+    repeated letter, and bail out on any forbidden bigram. Each forbidden
+    bigram (`ab`, `cd`, `pq`, `xy`) is a letter followed by its successor,
+    which keeps that check to one compare plus a small membership test.
+    """
+    vowels = 0
+    has_double = False
+    for i in range(b.shape[0]):
+        c = b[i]
+        vowels += vowel_flags[c]
+        if i > 0:
+            p = b[i - 1]
+            if p == c:
+                has_double = True
+            if c == p + 1 and (p == 97 or p == 99 or p == 112 or p == 120):
+                return False
+
+    return vowels >= 3 and has_double
 
 
 def is_nice(test_string: str) -> bool:
     """Returns True iff the input string is nice per the problem rules."""
-    return all(
-        [
-            # It contains at least three vowels.
-            letter_count("aeiou", test_string) >= 3,
-            # It contains at least one letter that appears twice in a row.
-            re.search(r"(\w)\1", test_string) is not None,
-            # It does **not** contain the strings `ab`, `cd`, `pq`, or `xy`.
-            not any(bad_str in test_string for bad_str in ["ab", "cd", "pq", "xy"]),
-        ]
-    )
+    b = np.frombuffer(test_string.encode("ascii"), dtype=np.uint8)
+    return bool(_scan_nice(b))
 
 
 def part1(input: str) -> int:
@@ -126,17 +166,41 @@ How many strings are nice under these new rules?
 # === Part 2 Solution: ===
 
 
+@numba.njit
+def _scan_nice2(b: np.ndarray) -> bool:
+    """
+    One pass deciding both part 2 rules. The sandwich rule is just
+    `b[i] == b[i - 2]`. For the repeated-pair rule, each pair of adjacent
+    letters is keyed as a 16-bit int into a 65536-slot seen bitmap — but a
+    pair is only *marked* two steps after it ends, so the pair ending at `i`
+    can only ever hit pairs that ended at `i - 2` or earlier. That delay is
+    what keeps the two overlapping `aa`s in `aaa` from counting, with no
+    per-pair index bookkeeping at all. This replaces the `([a-z]{2}).*\\1`
+    backtracking search, which is quadratic in the worst case.
+    """
+    has_sandwich = False
+    has_repeated_pair = False
+    seen_pairs = np.zeros(65536, dtype=np.uint8)
+
+    for i in range(1, b.shape[0]):
+        if i >= 2 and b[i] == b[i - 2]:
+            has_sandwich = True
+
+        if i >= 3:
+            seen_pairs[int(b[i - 3]) * 256 + int(b[i - 2])] = 1
+        if seen_pairs[int(b[i - 1]) * 256 + int(b[i])]:
+            has_repeated_pair = True
+
+        if has_sandwich and has_repeated_pair:
+            return True
+
+    return False
+
+
 def is_nice2(test_string: str) -> bool:
-    return all(
-        [
-            # It contains a pair of any two letters that appears at least twice
-            # in the string without overlapping
-            re.search(r"(\w\w).*\1", test_string) is not None,
-            # It contains at least one letter which repeats with exactly one
-            # letter between them
-            re.search(r"(\w).\1", test_string) is not None,
-        ]
-    )
+    """Returns True iff the input string is nice per the part 2 rules."""
+    b = np.frombuffer(test_string.encode("ascii"), dtype=np.uint8)
+    return bool(_scan_nice2(b))
 
 
 def part2(input: str) -> int:
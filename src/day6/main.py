@@ -23,37 +23,49 @@ doing the instructions Santa sent you in order.
 
 
 from enum import Enum
-import itertools
+from functools import lru_cache
 import re
-from typing import Iterable, NamedTuple, TypeVar
+from typing import NamedTuple
+
+import numba
+import numpy as np
 
 
 def test_part1() -> None:
     """For example:"""
-    lights = new_grid((1000, 1000), False)
-    assert all(not lit for lit in lights.values())
+    lights = new_grid((1000, 1000), np.bool_)
+    assert not lights.any()
 
     # > `turn on 0,0 through 999,999` would turn on (or leave on) every light.
     perform_instruction("turn on 0,0 through 999,999", lights)
-    assert all(lit for lit in lights.values())
+    assert lights.all()
 
     # > `toggle 0,0 through 999,0` would toggle the first line of 1000 lights,
     # > turning off the ones that were on, and turning on the ones that were
     # > off.
     perform_instruction("toggle 0,0 through 999,0", lights)
-    assert all(not lights[Pos(x, 0)] for x in range(1000))
+    assert not lights[:, 0].any()
 
     # > `turn off 499,499 through 500,500` would turn off (or leave off) the
     # > middle four lights.
     perform_instruction("turn off 499,499 through 500,500", lights)
-    assert all(
-        [
-            not lights[Pos(499, 499)],
-            not lights[Pos(499, 500)],
-            not lights[Pos(500, 499)],
-            not lights[Pos(500, 500)],
-        ]
+    assert not lights[499:501, 499:501].any()
+
+
+def test_part1_diff() -> None:
+    """The difference-array variant matches the direct one."""
+    instructions = parse_all_instructions(
+        "\n".join(
+            [
+                "turn on 0,0 through 999,999",
+                "toggle 0,0 through 999,0",
+                "toggle 10,10 through 499,499",
+                "turn off 499,499 through 500,500",
+                "toggle 0,0 through 99,99",
+            ]
+        )
     )
+    assert part1_diff(instructions) == part1(instructions)
 
 
 """
@@ -63,30 +75,22 @@ After following the instructions, **how many lights are lit**?
 # === Part 1 Solution: ===
 
 
-class Pos(NamedTuple):
-    """
-    This class represents a location on the problem grid.
-    """
-
-    x: int
-    y: int
-
-
-# Grids are a generic type to support using `bool`s in part 1 and `int`s in part 2.
-T = TypeVar("T")
-Grid = dict[Pos, T]
+# My first version stored the grid as a `dict[Pos, bool | int]` with a
+# million NamedTuple keys — every instruction became up to a million hash
+# lookups, and each entry cost hundreds of bytes. A contiguous NumPy array
+# stores one light per cell and lets every instruction act on a whole
+# rectangle with a single slice operation. The element type is `np.bool_` for
+# part 1's on/off lights — one byte per light, with toggling a single
+# SIMD-backed XOR pass over the rectangle — and `np.int32` for part 2's
+# brightness levels.
 
 
-def new_grid(size: tuple[int, int], initial_state: T) -> Grid[T]:
+def new_grid(size: tuple[int, int], dtype: type) -> np.ndarray:
     """
-    Makes and returns a new grid with the given size with all positions in the
-    same initial state.
+    Makes and returns a new grid with the given size with all lights starting
+    at zero.
     """
-    size_x, size_y = size
-    return dict(
-        (Pos(x, y), initial_state)
-        for x, y in itertools.product(range(size_x), range(size_y))
-    )
+    return np.zeros(size, dtype=dtype)
 
 
 class InstructionKind(Enum):
@@ -96,9 +100,17 @@ class InstructionKind(Enum):
 
 
 class Instruction(NamedTuple):
+    """
+    The corners are stored as four plain ints rather than `range` objects:
+    consumers only ever want slice bounds, and raw ints hand those over
+    without allocating and re-unpacking a range per axis.
+    """
+
     kind: InstructionKind
-    x_range: Iterable[int]
-    y_range: Iterable[int]
+    x0: int
+    y0: int
+    x1: int
+    y1: int
 
 
 instruction_pattern = re.compile(
@@ -106,14 +118,16 @@ instruction_pattern = re.compile(
 )
 
 
+@lru_cache(maxsize=None)
 def parse_instruction(instruction_string: str) -> Instruction:
     """
-    Parse an instruction string into a named tuple.
+    Parse an instruction string into a named tuple. The result is cached, so
+    running the same instruction again — as the tests and repeated part runs
+    do — skips the regex match and all the int parsing after the first time.
 
         >>> parse_instruction("turn on 0,0 through 999,999")
         Instruction(kind=<InstructionKind.on: 'turn on'>,
-            x_range=range(0, 1000),
-            y_range=range(0, 1000))
+            x0=0, y0=0, x1=999, y1=999)
     """
     m = instruction_pattern.fullmatch(instruction_string)
     if not m:
@@ -127,48 +141,171 @@ def parse_instruction(instruction_string: str) -> Instruction:
 
     return Instruction(
         kind=InstructionKind(m.group("kind")),
-        x_range=range(min_x, max_x + 1),
-        y_range=range(min_y, max_y + 1),
+        x0=min_x,
+        y0=min_y,
+        x1=max_x,
+        y1=max_y,
     )
 
 
-def perform_instruction(instruction_string: str, grid: Grid[bool]) -> None:
+def perform_instruction(instruction_string: str, grid: np.ndarray) -> None:
     """
-    Follow the instruction to modify the grid in place.
+    Follow the instruction to modify the grid in place. Each instruction is a
+    single slice assignment over the affected rectangle; toggling is an XOR.
     """
     instruction = parse_instruction(instruction_string)
-
-    positions = map(
-        Pos._make, itertools.product(instruction.x_range, instruction.y_range)
+    rect = (
+        slice(instruction.x0, instruction.x1 + 1),
+        slice(instruction.y0, instruction.y1 + 1),
     )
 
     match instruction.kind:
         case InstructionKind.on:
-            for pos in positions:
-                grid[pos] = True
+            grid[rect] = True
 
         case InstructionKind.off:
-            for pos in positions:
-                grid[pos] = False
+            grid[rect] = False
 
         case InstructionKind.toggle:
-            for pos in positions:
-                grid[pos] = not grid[pos]
+            grid[rect] ^= True
+
+
+# Parsing instruction-by-instruction costs a regex match, four int casts, an
+# enum lookup, and a NamedTuple per line, every time `part1` or `part2` runs.
+# One `findall` over the whole input collects every instruction at once, and
+# the kinds become small int codes so the parsed program fits in a compact
+# `(N, 5)` array of `(kind, x0, y0, x1, y1)` rows.
+all_instructions_pattern = re.compile(
+    r"(turn on|turn off|toggle) (\d+),(\d+) through (\d+),(\d+)"
+)
+
+kind_codes = {kind.value: code for code, kind in enumerate(InstructionKind)}
+
 
+def parse_all_instructions(input: str) -> np.ndarray:
+    """
+    Parse every instruction in the input with a single regex pass, returning
+    an `(N, 5)` int16 array of `(kind, min_x, min_y, max_x, max_y)` rows.
+
+        >>> parse_all_instructions("turn on 0,0 through 999,999").tolist()
+        [[0, 0, 0, 999, 999]]
+    """
+    rows = []
+    for kind, x1, y1, x2, y2 in all_instructions_pattern.findall(input):
+        a, b, c, d = int(x1), int(y1), int(x2), int(y2)
+        rows.append((kind_codes[kind], min(a, c), min(b, d), max(a, c), max(b, d)))
+
+    return np.array(rows, dtype=np.int16).reshape(-1, 5)
+
+
+# Applying one NumPy slice per instruction still pays Python dispatch and
+# ufunc setup per instruction, which adds up when many instructions cover
+# small rectangles. These Numba kernels run the entire instruction list in
+# one compiled call, with the per-cell work lowered to tight nested loops.
+
+
+@numba.njit(boundscheck=False)
+def apply_instructions(instructions: np.ndarray, grid: np.ndarray) -> None:
+    """Apply every parsed instruction to the grid under the part 1 rules."""
+    for i in range(instructions.shape[0]):
+        kind = instructions[i, 0]
+        x0, y0, x1, y1 = (
+            instructions[i, 1],
+            instructions[i, 2],
+            instructions[i, 3],
+            instructions[i, 4],
+        )
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                if kind == 0:
+                    grid[x, y] = True
+                elif kind == 1:
+                    grid[x, y] = False
+                else:
+                    grid[x, y] ^= True
+
+
+@numba.njit(boundscheck=False)
+def apply_instructions2(instructions: np.ndarray, grid: np.ndarray) -> None:
+    """Apply every parsed instruction to the grid under the part 2 rules."""
+    for i in range(instructions.shape[0]):
+        kind = instructions[i, 0]
+        x0, y0, x1, y1 = (
+            instructions[i, 1],
+            instructions[i, 2],
+            instructions[i, 3],
+            instructions[i, 4],
+        )
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                if kind == 0:
+                    grid[x, y] += 1
+                elif kind == 1:
+                    if grid[x, y] > 0:
+                        grid[x, y] -= 1
+                else:
+                    grid[x, y] += 2
+
+
+def part1(instructions: np.ndarray) -> int:
+    """
+    Perform each parsed instruction on a 1000 by 1000 grid of lights and
+    return the number of lights lit at the end. Both parts take the already
+    parsed instruction array so one `parse_all_instructions` pass in
+    `__main__` serves them both.
+    """
+
+    lights = new_grid((1000, 1000), np.bool_)
+    apply_instructions(instructions, lights)
+    return int(lights.sum())
+
+
+def flush_toggles(toggle_diff: np.ndarray, lights: np.ndarray) -> None:
+    """
+    Apply every toggle recorded in the corner-marked difference array to the
+    lights with one prefix-XOR along each axis, then clear the marks.
+    """
+    parity = np.bitwise_xor.accumulate(toggle_diff, axis=0)
+    parity = np.bitwise_xor.accumulate(parity, axis=1)
+    lights ^= parity[:-1, :-1]
+    toggle_diff[:] = 0
 
-def part1(input: str) -> int:
+
+def part1_diff(instructions: np.ndarray) -> int:
     """
-    Perform each line of input as an instruction on a 1000 by 1000 grid of
-    lights and return the number of lights lits at the end.
+    An alternative to `part1` built on a 2D difference array. A toggle only
+    marks its rectangle's four corners — O(1) instead of O(area) — and a run
+    of consecutive toggles is collapsed into one prefix-XOR pass when it ends.
+    Turning lights on or off overwrites state, so those instructions don't
+    commute with toggling and force the pending toggles to be flushed first
+    (the same reason the trick can't cover part 2, whose clamp at zero is
+    order-dependent). This wins when toggles dominate and their rectangles
+    are large; heavily interleaved inputs are better served by `part1`.
     """
+    lights = new_grid((1000, 1000), np.bool_)
+    toggle_diff = np.zeros((1001, 1001), dtype=np.bool_)
+    toggles_pending = False
+
+    for kind, x0, y0, x1, y1 in instructions:
+        if kind == 2:
+            toggle_diff[x0, y0] ^= True
+            toggle_diff[x1 + 1, y0] ^= True
+            toggle_diff[x0, y1 + 1] ^= True
+            toggle_diff[x1 + 1, y1 + 1] ^= True
+            toggles_pending = True
+            continue
 
-    lights = new_grid((1000, 1000), False)
-    instructions = input.splitlines()
+        if toggles_pending:
+            flush_toggles(toggle_diff, lights)
+            toggles_pending = False
 
-    for instruction in instructions:
-        perform_instruction(instruction, lights)
+        x_stop, y_stop = x1 + 1, y1 + 1
+        lights[x0:x_stop, y0:y_stop] = kind == 0
 
-    return sum(lights.values())
+    if toggles_pending:
+        flush_toggles(toggle_diff, lights)
+
+    return int(lights.sum())
 
 
 """
@@ -198,12 +335,12 @@ instructions?
 
 def test_part2() -> None:
     """For example:"""
-    lights = new_grid((1000, 1000), 0)
-    assert all(brightness == 0 for brightness in lights.values())
+    lights = new_grid((1000, 1000), np.int32)
+    assert not lights.any()
 
     # > `turn on 0,0 through 0,0` would increase the total brightness by `1`.
     perform_instruction2("turn on 0,0 through 0,0", lights)
-    assert lights[Pos(0, 0)] == 1
+    assert lights[0, 0] == 1
     assert total_brightness(lights) == 1
 
     # > `toggle 0,0 through 999,999` would increase the total brightness by `2000000`.
@@ -214,59 +351,57 @@ def test_part2() -> None:
 # === Part 2 Solution: ===
 
 
-def perform_instruction2(instruction_string: str, grid: Grid[int]) -> None:
+def perform_instruction2(instruction_string: str, grid: np.ndarray) -> None:
     """
     Follow the instruction to modify the grid in place, except according to the
-    part 2 rules this time.
+    part 2 rules this time. Dimming writes through a view of the rectangle so
+    the subtract-then-clamp-at-zero happens without temporaries.
     """
     instruction = parse_instruction(instruction_string)
-
-    positions = map(
-        Pos._make, itertools.product(instruction.x_range, instruction.y_range)
+    rect = (
+        slice(instruction.x0, instruction.x1 + 1),
+        slice(instruction.y0, instruction.y1 + 1),
     )
 
     match instruction.kind:
         case InstructionKind.on:
-            for pos in positions:
-                grid[pos] += 1
+            grid[rect] += 1
 
         case InstructionKind.off:
-            for pos in positions:
-                if grid[pos] > 0:
-                    grid[pos] -= 1
+            region = grid[rect]
+            np.subtract(region, 1, out=region)
+            np.maximum(region, 0, out=region)
 
         case InstructionKind.toggle:
-            for pos in positions:
-                grid[pos] += 2
+            grid[rect] += 2
 
 
-def total_brightness(lights: Grid[int]) -> int:
+def total_brightness(lights: np.ndarray) -> int:
     """
-    Returns the total brightness for a grid of lights.
+    Returns the total brightness for a grid of lights. The reduction runs in
+    int64 so an adversarially long instruction list can't overflow the int32
+    cells' sum.
     """
-    return sum(lights.values())
+    return int(lights.sum(dtype=np.int64))
 
 
-def part2(input: str) -> int:
+def part2(instructions: np.ndarray) -> int:
     """
-    Perform each line of input as an instruction on a 1000 by 1000 grid of
-    lights and return the number of lights lits at the end.
+    Perform each parsed instruction on a 1000 by 1000 grid of lights and
+    return the total brightness at the end.
     """
 
-    lights = new_grid((1000, 1000), 0)
-    instructions = input.splitlines()
-
-    for instruction in instructions:
-        perform_instruction2(instruction, lights)
-
+    lights = new_grid((1000, 1000), np.int32)
+    apply_instructions2(instructions, lights)
     return total_brightness(lights)
 
 
 if __name__ == "__main__":
-    puzzle_input = open("input.txt").read()
+    # Parse the instructions once and hand the same array to both parts
+    puzzle_instructions = parse_all_instructions(open("input.txt").read())
 
     # Print out part 1 solution
-    print("Part 1:", part1(puzzle_input))
+    print("Part 1:", part1(puzzle_instructions))
 
     # Print out part 2 solution
-    print("Part 2:", part2(puzzle_input))
+    print("Part 2:", part2(puzzle_instructions))
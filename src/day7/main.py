@@ -37,10 +37,11 @@ for these gates.
 """
 
 
-from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections import deque
 import logging
-import re
+
+import numba
+import numpy as np
 
 
 def test_part1() -> None:
@@ -90,11 +91,14 @@ values yet. This means that all gate descriptions will have to be parsed out
 beforehand and then resolved in the appropriate order.
 
 This circuit resolution algorithm could be done in a pure brute force way, but
-I'd like to find an easy way to make it faster and simpler to reason about. The
-first thing to come to mind is having two sets of wires: the set that are known
-about but don't have a value yet, and the set that have values already. Then,
-if part of a gate's information is the set of wires that are needed as inputs,
-a single set operation can be done to see if all required wires have values yet.
+I'd like to find an easy way to make it faster and simpler to reason about. My
+first cut gave each gate a frozenset of required input wires and asked, over
+and over, whether that set was a subset of the wires with known values. That
+works, but it pays for a KeysView and a hash of every wire name on every
+check, and a set also forgets which input is which — fine for AND and OR,
+but a trap for anything non-commutative. Gates now keep their inputs in
+positional order and the resolution order comes from the dependency graph
+itself, so no per-iteration membership test is needed at all.
 
 ### Types
 
@@ -115,182 +119,89 @@ WireValues = dict[Wire, Value]
 MAX_VALUE: Value = 2**16 - 1
 
 
-@dataclass(eq=True, frozen=True)
-class Gate(ABC):
-    """
-    Gates have a set of input wires, one output wire, and a way of resolving the
-    input values into the output values. Inputs can be provided as a wire name
-    that needs to be resolved or as a preset static value.
-
-    This abstract base class cannot be used directly. Subclasses must be made
-    for each type of gate which implement the `resolve_ouput_value()` method.
-
-    > This got a little nastier than I'd hoped since I needed these `Gate`
-    objects to be hashable in the logic below. This required the use of frozen
-    dataclasses and frozen sets. The gate objects themselves should never
-    change, so that's fine. It just adds more syntactic noise.
-    """
+"""
+I originally modeled gates as a small hierarchy of frozen dataclasses with
+frozenset inputs and a virtual `resolve_output_value()` per subclass. That
+read nicely, but every gate cost several allocations and every resolution a
+method dispatch, and the frozensets threw away input order (harmless only
+because the shift amounts were stored separately). Gates are now plain
+tuples: tiny, hashable for free, ordered, and cheap to pull apart.
+"""
 
-    # Note that all gates in the problem don't care about wire order, so there
-    # is no need to remember the wire order.
-    wire_inputs: frozenset[Wire]
-    static_inputs: frozenset[Value]
-    output: Wire
+# The six kinds of gate, as small int opcodes
+OP_CONN, OP_AND, OP_OR, OP_LSHIFT, OP_RSHIFT, OP_NOT = range(6)
 
-    @abstractmethod
-    def resolve_output_value(self, *values: Value) -> Value:
-        return 0
+# A gate input is either a wire name to be resolved or a literal value
+GateInput = Wire | Value
 
+# A gate is a flat `(opcode, a, b, output)` tuple. Single-input gates carry a
+# literal `0` in the unused `b` slot; shifts carry their shift amount there.
+Gate = tuple[int, GateInput, GateInput, Wire]
 
-@dataclass(eq=True, frozen=True)
-class ConnectionGate(Gate):
-    """This represents two wires being connected"""
 
-    def resolve_output_value(self, *values: Value) -> Value:
-        (a,) = values
+def gate_output_value(op: int, a: Value, b: Value) -> Value:
+    """Combine two resolved input values according to the gate's opcode."""
+    if op == OP_CONN:
         return a
-
-
-@dataclass(eq=True, frozen=True)
-class AndGate(Gate):
-    """This represents the AND gate"""
-
-    def resolve_output_value(self, *values: Value) -> Value:
-        a, b = values
+    if op == OP_AND:
         return a & b
-
-
-@dataclass(eq=True, frozen=True)
-class OrGate(Gate):
-    """This represents the OR gate"""
-
-    def resolve_output_value(self, *values: Value) -> Value:
-        a, b = values
+    if op == OP_OR:
         return a | b
+    if op == OP_LSHIFT:
+        # Need to mask off the return value in case the value was shifted
+        # beyond the 16 bit limit.
+        return (a << b) & MAX_VALUE
+    if op == OP_RSHIFT:
+        return a >> b
 
+    # OP_NOT. Bitwise NOT in Python is weird since all ints are signed with
+    # arbitrary precision. Using subtraction as a workaround.
+    return MAX_VALUE - a
 
-@dataclass(eq=True, frozen=True)
-class LShiftGate(Gate):
-    """This represents the LSHIFT gate"""
-
-    shift_amount: int
-
-    def resolve_output_value(self, *values: Value) -> Value:
-        (a,) = values
-        # Need to mask off the return value in case the value was shifted beyond
-        # the 16 bit limit.
-        return (a << self.shift_amount) & MAX_VALUE
 
+def gate_wire_inputs(gate: Gate) -> tuple[Wire, ...]:
+    """The wire-name inputs of a gate, skipping any literal values."""
+    _, a, b, _ = gate
+    return tuple(ref for ref in (a, b) if isinstance(ref, str))
 
-@dataclass(eq=True, frozen=True)
-class RShiftGate(Gate):
-    """This represents the RSHIFT gate"""
 
-    shift_amount: int
+def as_gate_input(token: str) -> GateInput:
+    """Parse an input token into a literal value or a wire name."""
+    return int(token) if token.isdecimal() else token
 
-    def resolve_output_value(self, *values: Value) -> Value:
-        (a,) = values
-        return a >> self.shift_amount
 
+# The two-input gate keywords, mapped to their opcodes
+BINARY_OPS = {"AND": OP_AND, "OR": OP_OR, "LSHIFT": OP_LSHIFT, "RSHIFT": OP_RSHIFT}
 
-@dataclass(eq=True, frozen=True)
-class NotGate(Gate):
-    """This represents the NOT gate"""
 
-    def resolve_output_value(self, *values: Value) -> Value:
-        (a,) = values
-        # Bitwise NOT in Python is weird since all ints are signed with
-        # arbitrary precision. Using subtraction as a workaround.
-        return MAX_VALUE - a
-
-
-def classify_inputs(*inputs: str) -> tuple[frozenset[Wire], frozenset[Value]]:
+def parse_line(line: str) -> tuple[Wire, Value] | Gate:
     """
-    This parser helper function separates inputs into wire and static value
-    sets.
+    This function takes in a line from the input and parses it into the
+    appropriate value. I first expressed the line grammar as one big compiled
+    regex alternation, but every line is really just whitespace-separated
+    tokens around a `->` marker, so a single C-level `str.split` does the
+    lexing and the token count alone classifies the line: three tokens is an
+    assignment or wire connection, four is a NOT gate, five is a binary gate.
     """
-    wire_set = set()
-    value_set = set()
-
-    for input in inputs:
-        if input.isdecimal():
-            value_set.add(int(input))
-        else:
-            wire_set.add(input)
+    tokens = line.split()
+    output = tokens[-1]
 
-    return frozenset(wire_set), frozenset(value_set)
+    # Initial values being assigned directly to wires, and wire connections
+    if len(tokens) == 3:
+        source = as_gate_input(tokens[0])
+        if isinstance(source, int):
+            return (output, source)
+        return (OP_CONN, source, 0, output)
 
+    # NOT gates
+    if len(tokens) == 4:
+        return (OP_NOT, as_gate_input(tokens[1]), 0, output)
 
-def parse_line(line: str) -> tuple[Wire, Value] | Gate:
-    """
-    This function takes in a line from the input and parses it into the
-    appropriate value. All input lines are either values being assigned directly
-    to wires or gate descriptions.
-    """
-    wire = r"[a-z]+"
-    value = r"\d+"
-    input = f"(?:{wire})|(?:{value})"
-
-    # Match initial values being assigned directly to wires
-    if m := re.fullmatch(rf"({value}) -> ({wire})", line):
-        value, wire = m.groups()
-        return (wire, int(value))
-
-    # Match wire connections
-    if m := re.fullmatch(rf"({input}) -> ({wire})", line):
-        input1, output = m.groups()
-        wire_inputs, static_inputs = classify_inputs(input1)
-        return ConnectionGate(
-            wire_inputs=wire_inputs, static_inputs=static_inputs, output=output
-        )
-
-    # Match AND gates
-    if m := re.fullmatch(rf"({input}) AND ({input}) -> ({wire})", line):
-        input1, input2, output = m.groups()
-        wire_inputs, static_inputs = classify_inputs(input1, input2)
-        return AndGate(
-            wire_inputs=wire_inputs, static_inputs=static_inputs, output=output
-        )
-
-    # Match OR gates
-    if m := re.fullmatch(rf"({input}) OR ({input}) -> ({wire})", line):
-        input1, input2, output = m.groups()
-        wire_inputs, static_inputs = classify_inputs(input1, input2)
-        return OrGate(
-            wire_inputs=wire_inputs, static_inputs=static_inputs, output=output
-        )
-
-    # Match LSHIFT gates
-    if m := re.fullmatch(rf"({input}) LSHIFT ({value}) -> ({wire})", line):
-        input1, value, output = m.groups()
-        wire_inputs, static_inputs = classify_inputs(input1)
-        return LShiftGate(
-            wire_inputs=wire_inputs,
-            static_inputs=static_inputs,
-            shift_amount=int(value),
-            output=output,
-        )
-
-    # Match RSHIFT gates
-    if m := re.fullmatch(rf"({input}) RSHIFT ({value}) -> ({wire})", line):
-        input1, value, output = m.groups()
-        wire_inputs, static_inputs = classify_inputs(input1)
-        return RShiftGate(
-            wire_inputs=wire_inputs,
-            static_inputs=static_inputs,
-            shift_amount=int(value),
-            output=output,
-        )
-
-    # Match NOT gates
-    if m := re.fullmatch(rf"NOT ({input}) -> ({wire})", line):
-        input1, output = m.groups()
-        wire_inputs, static_inputs = classify_inputs(input1)
-        return NotGate(
-            wire_inputs=wire_inputs, static_inputs=static_inputs, output=output
-        )
-
-    raise ValueError(f"Could not parse line: '{line}'")
+    # AND, OR, LSHIFT, and RSHIFT gates
+    if len(tokens) != 5 or tokens[1] not in BINARY_OPS:
+        raise ValueError(f"Could not parse line: '{line}'")
+    op = BINARY_OPS[tokens[1]]
+    return (op, as_gate_input(tokens[0]), as_gate_input(tokens[2]), output)
 
 
 def parse_input(input: str) -> tuple[list[tuple[Wire, Value]], list[Gate]]:
@@ -301,10 +212,11 @@ def parse_input(input: str) -> tuple[list[tuple[Wire, Value]], list[Gate]]:
     initial_values = []
     unresolved_gates = []
 
-    # Parse the input into initial values and gate descriptions
+    # Parse the input into initial values and gate descriptions. Gate tuples
+    # have four fields; initial value assignments only two.
     for line in input.strip().splitlines():
         value = parse_line(line.strip())
-        if isinstance(value, Gate):
+        if len(value) == 4:
             unresolved_gates.append(value)
         else:
             initial_values.append(value)
@@ -312,56 +224,183 @@ def parse_input(input: str) -> tuple[list[tuple[Wire, Value]], list[Gate]]:
     return initial_values, unresolved_gates
 
 
+# A gate translated to id-coded form: `(opcode, a, b, output)` where each
+# input is a non-negative wire id or a bit-inverted literal (`~value`),
+# keeping both cases in one plain int.
+CodedGate = tuple[int, int, int, int]
+
+
+def code_gates(
+    gates: list[Gate], wire_values: WireValues
+) -> tuple[dict[Wire, int], list[CodedGate], np.ndarray]:
+    """
+    Intern every wire name to a dense integer id and translate the gates to
+    id-coded form, alongside a flat int32 signal array (sentinel -1 = no
+    signal yet) pre-filled with the known wire values. Resolution can then
+    run over plain ints instead of hashing wire-name strings for every read
+    and write.
+    """
+    wire_ids: dict[Wire, int] = {}
+    for wire in wire_values:
+        wire_ids.setdefault(wire, len(wire_ids))
+
+    coded_gates = []
+    for op, a, b, output in set(gates):
+        coded_a = wire_ids.setdefault(a, len(wire_ids)) if isinstance(a, str) else ~a
+        coded_b = wire_ids.setdefault(b, len(wire_ids)) if isinstance(b, str) else ~b
+        coded_out = wire_ids.setdefault(output, len(wire_ids))
+        coded_gates.append((op, coded_a, coded_b, coded_out))
+
+    values = np.full(len(wire_ids), -1, dtype=np.int32)
+    for wire, value in wire_values.items():
+        values[wire_ids[wire]] = value
+
+    return wire_ids, coded_gates, values
+
+
 def resolve_wire_values(gates: list[Gate], wire_values: WireValues) -> WireValues:
     """
     Resolve all the gates in a valid order while updating the wire value
     dictionary with the gate outputs. Once all gates have been resolved, return
     the final resulting wire value dictionary.
-    """
 
-    unresolved_gates = set(gates)
+    My first version rescanned the whole unresolved set looking for any gate
+    whose inputs had all arrived, which is quadratic in the number of gates.
+    This is really a topological-sort problem, so now it's Kahn's algorithm:
+    each gate remembers how many of its inputs are still missing, each wire
+    knows which gates are waiting on it, and resolving a wire only touches
+    the gates that actually depend on it. The wires are interned and the
+    gates id-coded by `code_gates` first, so everything here works in plain
+    ints.
+    """
+    wire_ids, coded_gates, values = code_gates(gates, wire_values)
+
+    # Index the dependency graph: how many inputs each gate is still missing,
+    # and which gates each wire feeds into. Gates missing nothing are ready
+    # to resolve immediately.
+    missing_input_counts = []
+    dependents: dict[int, list[int]] = {}
+    ready: deque[int] = deque()
+
+    for index, (op, coded_a, coded_b, _) in enumerate(coded_gates):
+        unresolved = [ref for ref in (coded_a, coded_b) if ref >= 0 and values[ref] < 0]
+        missing_input_counts.append(len(unresolved))
+        for wire_id in unresolved:
+            dependents.setdefault(wire_id, []).append(index)
+        if not unresolved:
+            ready.append(index)
+
+    # Readiness never depends on the actual signal values, so the Kahn loop
+    # only works out a full execution order here; the arithmetic itself is
+    # handed to the compiled kernel in one call afterwards.
+    order = []
+    while ready:
+        index = ready.popleft()
+        order.append(index)
+        out_id = coded_gates[index][3]
+
+        for dependent in dependents.get(out_id, ()):
+            missing_input_counts[dependent] -= 1
+            if missing_input_counts[dependent] == 0:
+                ready.append(dependent)
+
+    if len(order) < len(coded_gates):
+        raise ValueError("No gates found with all resolved inputs")
+
+    ops = np.array([gate[0] for gate in coded_gates], dtype=np.int8)
+    refs_a = np.array([gate[1] for gate in coded_gates], dtype=np.int32)
+    refs_b = np.array([gate[2] for gate in coded_gates], dtype=np.int32)
+    outs = np.array([gate[3] for gate in coded_gates], dtype=np.int32)
+    run_gates(ops, refs_a, refs_b, outs, np.array(order, dtype=np.int32), values)
+
+    return {wire: int(values[i]) for wire, i in wire_ids.items() if values[i] >= 0}
+
+
+@numba.njit
+def run_gates(
+    ops: np.ndarray,
+    refs_a: np.ndarray,
+    refs_b: np.ndarray,
+    outs: np.ndarray,
+    order: np.ndarray,
+    values: np.ndarray,
+) -> None:
+    """
+    Execute the id-coded gates in the given topological order, writing each
+    output signal into the values array. This mirrors `gate_output_value`,
+    except NOT becomes `(~a) & 0xFFFF` — in the kernel's fixed-width ints
+    that's a plain and-not rather than Python's arbitrary-precision headache.
+    """
+    for k in range(order.shape[0]):
+        i = order[k]
+        ref_a = refs_a[i]
+        ref_b = refs_b[i]
+        a = values[ref_a] if ref_a >= 0 else ~ref_a
+        b = values[ref_b] if ref_b >= 0 else ~ref_b
+
+        op = ops[i]
+        if op == OP_CONN:
+            result = a
+        elif op == OP_AND:
+            result = a & b
+        elif op == OP_OR:
+            result = a | b
+        elif op == OP_LSHIFT:
+            result = (a << b) & MAX_VALUE
+        elif op == OP_RSHIFT:
+            result = a >> b
+        else:
+            result = (~a) & MAX_VALUE
 
-    # Keep looping until all gates are resolved
-    while len(unresolved_gates) > 0:
-        logging.debug(wire_values)
+        values[outs[i]] = result
 
-        # Find a gate whose input wires all have values
-        for gate in unresolved_gates:
-            if gate.wire_inputs.issubset(wire_values.keys()):
-                break
-        else:
-            logging.error(wire_values)
-            logging.error(unresolved_gates)
-            raise ValueError("No gates found with all resolved inputs")
 
-        logging.debug(f"Resolving gate {gate}")
+def build_producers(
+    initial_values: list[tuple[Wire, Value]], gates: list[Gate]
+) -> dict[Wire, Gate | Value]:
+    """
+    Map every wire to whatever produces its signal — either a static value or
+    the gate whose output feeds it.
+    """
+    producers: dict[Wire, Gate | Value] = dict(initial_values)
+    for gate in gates:
+        producers[gate[3]] = gate
+    return producers
 
-        # Get the gate's resolved value
-        resolved_value = gate.resolve_output_value(
-            *(wire_values[wire] for wire in gate.wire_inputs), *gate.static_inputs
-        )
 
-        # Record the gate's resolved value to its output wire
-        wire_values[gate.output] = resolved_value
+def evaluate_wire(
+    wire: Wire, producers: dict[Wire, Gate | Value], cache: WireValues
+) -> Value:
+    """
+    Work out a single wire's value by recursively evaluating just the gates it
+    depends on, memoizing each wire as it's settled. The puzzle only ever asks
+    about wire `a`, so anything `a` doesn't depend on is never touched — and
+    part 2's re-run with an overridden `b` is just a fresh cache.
+    """
+    if wire in cache:
+        return cache[wire]
 
-        # Remove the gate from the unresolved list
-        unresolved_gates.remove(gate)
+    producer = producers[wire]
+    if isinstance(producer, tuple):
+        op, a, b, _ = producer
+        value_a = evaluate_wire(a, producers, cache) if isinstance(a, str) else a
+        value_b = evaluate_wire(b, producers, cache) if isinstance(b, str) else b
+        value = gate_output_value(op, value_a, value_b)
+    else:
+        value = producer
 
-    return wire_values
+    cache[wire] = value
+    return value
 
 
 def part1(input: str) -> Value:
     """
-    Resolve all wire values according to the problem input's initial values and
-    gate descriptions. Return the final value on the `a` wire.
+    Evaluate the `a` wire on demand from the problem input's initial values
+    and gate descriptions.
     """
     initial_values, unresolved_gates = parse_input(input)
-
-    # Create the wire value dictionary with the parsed initial values
-    wire_values = dict(initial_values)
-
-    wire_values = resolve_wire_values(unresolved_gates, wire_values)
-    return wire_values["a"]
+    producers = build_producers(initial_values, unresolved_gates)
+    return evaluate_wire("a", producers, {})
 
 
 """
@@ -380,24 +419,17 @@ provided to wire `a`?
 
 def part2(input: str) -> Value:
     """
-    Resolve all wire values according to the problem input's initial values and
-    gate descriptions. Then, repeat the resolution with wire `b` set to the
-    value that `a` was resolved to in the initial resolution. Return the value
-    of `a` after the second resolution.
+    Evaluate the `a` wire, then re-evaluate it with wire `b` overridden to
+    that first result. Overriding just means swapping `b`'s producer for the
+    static value and starting from an empty cache.
     """
     initial_values, unresolved_gates = parse_input(input)
+    producers = build_producers(initial_values, unresolved_gates)
 
-    # Do first wire value resolution
-    first_wire_values = dict(initial_values)
-    first_wire_values = resolve_wire_values(unresolved_gates, first_wire_values)
-
-    # Recreate initial wire values with new `b` value set to the old `a` value
-    second_wire_values = dict(initial_values)
-    second_wire_values["b"] = first_wire_values["a"]
+    first_a = evaluate_wire("a", producers, {})
 
-    # Resolve again and return
-    second_wire_values = resolve_wire_values(unresolved_gates, second_wire_values)
-    return second_wire_values["a"]
+    producers["b"] = first_a
+    return evaluate_wire("a", producers, {})
 
 
 if __name__ == "__main__":
@@ -16,7 +16,14 @@ of characters **in the in-memory string itself**.
 """
 
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import os
 import re
+from typing import Optional
+
+import numba
+import numpy as np
 
 
 def test_part1() -> None:
@@ -51,6 +58,22 @@ def test_part1() -> None:
     assert len(example5) == 4
     assert character_count(example5) == 1
 
+    # > Combined, the four strings above total `23 - 11 = 12`.
+    combined = "\n".join([example1, example2, example3, example4])
+    assert part1(combined.encode("ascii")) == 12
+
+
+def test_character_count_lex() -> None:
+    """The run-lexing regex variant gives the same answers."""
+    for example in ['""', '"abc"', '"aaa\\"aaa"', '"\\x27"', '"\\\\"']:
+        assert character_count_lex(example) == character_count(example)
+
+
+def test_character_count_dfa() -> None:
+    """The table-driven DFA variant gives the same answers."""
+    for example in ['""', '"abc"', '"aaa\\"aaa"', '"\\x27"', '"\\\\"']:
+        assert character_count_dfa(example) == character_count(example)
+
 
 """
 Santa's list is a file that contains many double-quoted string literals, one on
@@ -72,34 +95,152 @@ memory for string values (`0 + 3 + 7 + 1 = 11`) is `23 - 11 = 12`.
 
 """
 Immediately I want to try using regex to count how many encoding patterns are
-matched in the string.
+matched in the string. That worked, but `re.findall` hands back a list of
+every matched substring just so it can be measured and thrown away; even
+keeping the regex, `sum(1 for _ in pattern.finditer(...))` counts matches
+without building any list. The scan below goes one step further and drops
+the regex engine too.
 """
 
 
+@lru_cache(maxsize=4096)
 def character_count(raw_string: str) -> int:
-    """Return the number of characters encoded in the raw string."""
+    """
+    Return the number of characters encoded in the raw string.
+
+    My first version matched every escape sequence (or lone character) with
+    one big `re.findall` alternation and took the length of the resulting
+    list — building a list of match strings just to count it. A single
+    left-to-right scan settles each position in one look instead: a
+    backslash starts an escape that decodes to one character and consumes
+    two code characters (or four, for `\\xHH`), and anything else decodes
+    as itself.
+
+    `part1` doesn't call this anymore — one Python call per line is exactly
+    the kind of per-line overhead its whole-file pass removes — so this
+    exists for the worked examples in `test_part1`.
+    """
 
-    # First, remove the beginning and end double quote.
-    clipped_string = raw_string[1:-1]
+    # Scan between the two surrounding quotes in place — slicing them off
+    # with `[1:-1]` would copy the whole line just to drop two characters.
+    count = 0
+    index = 1
+    end = len(raw_string) - 1
+    while index < end:
+        if raw_string[index] == "\\":
+            index += 4 if raw_string[index + 1] == "x" else 2
+        else:
+            index += 1
+        count += 1
+
+    return count
+
+
+# Even within the regex approach there was a better pattern available. The
+# original alternation ended in `.`, so every plain character produced its
+# own match — after paying for three failed alternatives first. Consuming
+# whole runs of plain characters with `[^\\]+` instead makes the number of
+# matches proportional to the escape density rather than the line length.
+# A regex call also carries fixed dispatch overhead, so one pass over the
+# whole joined input beats one call per line; the solutions below take that
+# idea to its limit by making their single whole-file pass with `find` and
+# `count` rather than the regex engine.
+#
+# This token set needs no backtracking at all, which makes it a textbook fit
+# for a DFA-based engine like Hyperscan or PCRE2's JIT rather than Python's
+# backtracking `re`. I'm not taking that rung: it means a compiled binary
+# dependency for a job the scans below finish in well under a millisecond,
+# and the whole-file counters sidestep tokenization entirely anyway.
+run_lex_pattern = re.compile(r"\\x[0-9a-fA-F]{2}|\\.|[^\\]+")
+
+
+def character_count_lex(raw_string: str) -> int:
+    """
+    A regex-lexer alternative to `character_count`: each match is either one
+    escape sequence, decoding to one character, or a whole run of plain
+    characters, decoding to itself.
+    """
+    count = 0
+    # A compiled pattern's finditer takes pos/endpos bounds, so the outer
+    # quotes are excluded without slicing a copy of the line.
+    for m in run_lex_pattern.finditer(raw_string, 1, len(raw_string) - 1):
+        group = m.group()
+        count += 1 if group[0] == "\\" else len(group)
+
+    return count
+
+
+# The escape language is regular and needs no backtracking, so the full
+# regex-to-NFA-to-DFA pipeline a lexer generator would run collapses to four
+# hand-minimized states: outside any escape, just after a backslash, and the
+# two hex digits of a `\xHH` escape.
+NORMAL, AFTER_BACKSLASH, HEX_HIGH, HEX_LOW = range(4)
+
+# transition_table[state][byte] -> (next state, decoded characters emitted)
+transition_table: list[list[tuple[int, int]]] = [
+    [(NORMAL, 1)] * 128,  # NORMAL: every plain byte decodes to itself...
+    [(NORMAL, 1)] * 128,  # AFTER_BACKSLASH: the escape decodes to one byte
+    [(HEX_LOW, 0)] * 128,  # HEX_HIGH: already counted, just consume
+    [(NORMAL, 0)] * 128,  # HEX_LOW: already counted, just consume
+]
+transition_table[NORMAL][ord("\\")] = (AFTER_BACKSLASH, 0)  # ...except this
+transition_table[AFTER_BACKSLASH][ord("x")] = (HEX_HIGH, 1)
+
+
+def character_count_dfa(raw_string: str) -> int:
+    """
+    A table-driven DFA alternative to `character_count`: every byte between
+    the quotes costs exactly one table lookup and one add, with no branching
+    on what the byte actually is.
+    """
+    count = 0
+    state = NORMAL
+    body = raw_string.encode("ascii")
+    for index in range(1, len(body) - 1):
+        state, emitted = transition_table[state][body[index]]
+        count += emitted
 
-    # Then match all the encoding patterns possible and return the number of
-    # matches.
-    return len(re.findall(r'\\x[0-9a-fA-F]{2}|\\"|\\\\|.', clipped_string))
+    return count
 
 
-def part1(input: str) -> int:
+def escape_shrinkage(data: bytes) -> int:
     """
-    Split the input lines and then count up the total input string lengths and
-    encoded character counts. Then return the different between the two
+    Return the number of characters that decoding the escapes in the given
+    text removes: one for each `\\\\` or `\\"`, three for each `\\xHH`. It
+    never looks at the plain characters at all — `bytes.find` jumps from
+    backslash to backslash at C speed, so only the escapes cost any Python
+    work. Escapes never span lines, so this works just as well on the whole
+    file as on a single line. The haystack is `bytes` rather than `str` on
+    purpose: the byte `find`/`count` loops are simple memchr-style scans,
+    with none of the flexible-width-storage handling a Unicode haystack
+    drags in.
     """
-    total_string_length = 0
-    total_character_count = 0
+    shrinkage = 0
+    index = data.find(b"\\")
+    while index != -1:
+        if data[index + 1] == ord("x"):
+            shrinkage += 3
+            index += 4
+        else:
+            shrinkage += 1
+            index += 2
+        index = data.find(b"\\", index)
+
+    return shrinkage
 
-    for raw_string in input.strip().splitlines():
-        total_string_length += len(raw_string)
-        total_character_count += character_count(raw_string)
 
-    return total_string_length - total_character_count
+def part1(data: bytes) -> int:
+    """
+    Sum the number of characters decoding removes — two surrounding quotes
+    per line, plus the escape shrinkage — in one pass over the entire file,
+    with no line splitting. A pure `count` closed form can't replace the
+    escape scan here: in `\\\\x` the `x` follows an escaped backslash rather
+    than starting a hex escape, and independent substring counts can't tell
+    those apart. Taking `bytes` keeps the whole pipeline from file to
+    counters free of intermediate `str` copies.
+    """
+    data = data.strip()
+    return 2 * (data.count(b"\n") + 1) + escape_shrinkage(data)
 
 
 """
@@ -143,6 +284,42 @@ def test_part2() -> None:
     assert string_repr(example1) == '"\\"\\\\x27\\""'
     assert len(string_repr(example1)) == 11
 
+    # > Combined, the four strings above total `42 - 23 = 19`.
+    combined = "\n".join(['""', '"abc"', '"aaa\\"aaa"', '"\\x27"'])
+    assert part2(combined.encode("ascii")) == 19
+
+
+def test_count_all() -> None:
+    """The fused one-pass counter matches both parts."""
+    examples = "\n".join(['""', '"abc"', '"aaa\\"aaa"', '"\\x27"', '"\\\\"'])
+    data = examples.encode("ascii")
+    assert count_all(data) == (part1(data), part2(data))
+
+
+def test_part2_pure() -> None:
+    """The word-at-a-time counter gives the same part 2 answers."""
+    examples = "\n".join(['""', '"abc"', '"aaa\\"aaa"', '"\\x27"', '"\\\\"'])
+    data = examples.encode("ascii")
+    assert part2_pure(data) == part2(data)
+
+    # Adjacent matches exercise the lanes within one 8-byte word.
+    assert _swar_count(b'\\\\\\""""\\ab\\"', ord("\\")) == 5
+    assert _swar_count(b'\\\\\\""""\\ab\\"', ord('"')) == 5
+
+
+def test_part2_numpy() -> None:
+    """The vectorized counter gives the same part 2 answers."""
+    examples = "\n".join(['""', '"abc"', '"aaa\\"aaa"', '"\\x27"', '"\\\\"'])
+    data = examples.encode("ascii")
+    assert part2_numpy(data) == part2(data)
+
+
+def test_count_all_parallel() -> None:
+    """Fanning the fused counter across workers changes nothing."""
+    examples = "\n".join(['""', '"abc"', '"aaa\\"aaa"', '"\\x27"', '"\\\\"'])
+    data = examples.encode("ascii")
+    assert count_all_parallel(data, workers=2) == count_all(data)
+
 
 """
 Your task is to find the **total number of characters to represent the newly
@@ -160,35 +337,176 @@ Again, regex calls to me.
 """
 
 
+@lru_cache(maxsize=4096)
 def string_repr(string: str) -> str:
-    """Return the escaped representation of the given string."""
+    """
+    Return the escaped representation of the given string.
 
-    # Put a backslash in front of any double quote or backslash characters.
-    s = re.sub(r'("|\\)', r"\\\1", string)
-    return '"' + s + '"'
+    Put a backslash in front of any double quote or backslash characters.
+    Both replacements are fixed literals, so two C-level `str.replace`
+    scans beat invoking the regex engine for them. Backslashes have to be
+    escaped first — otherwise the backslashes inserted in front of the
+    quotes would get escaped again.
+    """
+    return '"' + string.replace("\\", "\\\\").replace('"', '\\"') + '"'
 
 
-def part2(input: str) -> int:
+def part2(data: bytes) -> int:
     """
-    Split the input lines and then count up the total input string lengths and
-    the total number of characters in their escaped string representations.
-    Return the difference of the two
+    Sum the number of characters encoding adds. The growth is deterministic:
+    every line gains two new surrounding quotes, and every quote or
+    backslash anywhere gains one backslash in front of it. Building each
+    escaped representation with `string_repr` just to measure it would
+    allocate a new string per line; since newlines themselves need no
+    escaping, three C-level `count` calls over the entire file give the
+    same total with no line iteration or allocation at all.
     """
-    total_string_length = 0
-    total_repr_length = 0
+    data = data.strip()
+    return 2 * (data.count(b"\n") + 1) + data.count(b'"') + data.count(b"\\")
+
 
-    for raw_string in input.strip().splitlines():
-        total_string_length += len(raw_string)
-        total_repr_length += len(string_repr(raw_string))
+# Each part above makes its own passes over the input (one escape scan for
+# part 1, three counts for part 2). Everything either part needs can come out
+# of a single walk over the bytes, so here is that walk as one compiled
+# kernel — the closest thing this project has to dropping into C.
 
-    return total_repr_length - total_string_length
+
+@numba.njit
+def _count_all(buf: np.ndarray) -> tuple[int, int, int]:
+    """
+    One pass over the whole input collecting the line count, the decode
+    shrinkage from escapes, and the number of characters (quotes and
+    backslashes) that encoding must escape.
+    """
+    lines = 1
+    shrinkage = 0
+    escapable = 0
+    n = buf.shape[0]
+    i = 0
+
+    while i < n:
+        c = buf[i]
+        if c == 0x5C:  # backslash: an escape starts here
+            escapable += 1
+            if buf[i + 1] == 0x78:  # 'x'
+                shrinkage += 3
+                i += 4
+                continue
+            escapable += 1  # the escaped '\' or '"' is itself escapable too
+            shrinkage += 1
+            i += 2
+            continue
+        if c == 0x22:  # '"'
+            escapable += 1
+        elif c == 0x0A:  # newline
+            lines += 1
+        i += 1
+
+    return lines, shrinkage, escapable
+
+
+def count_all(data: bytes) -> tuple[int, int]:
+    """Return both parts' answers from a single pass over the input bytes."""
+    lines, shrinkage, escapable = _count_all(np.frombuffer(data, dtype=np.uint8))
+    return 2 * lines + shrinkage, 2 * lines + escapable
+
+
+def _swar_count(data: bytes, byte: int) -> int:
+    """
+    A dependency-free byte counter in the same spirit as day 1's
+    `part2_pure`: eight input bytes at a time are packed into one integer,
+    XORed against the broadcast target so matches become zero bytes, and
+    the zero bytes are flagged and popcounted with word arithmetic — no
+    per-byte branching. The zero test used here (`((w & 0x7f…) + 0x7f…) | w`
+    leaves the high bit of each byte clear iff the byte was zero) never
+    carries between lanes, unlike the shorter `(w - 0x01…) & ~w` trick,
+    whose borrows can miscount adjacent matches.
+    """
+    lows = 0x7F7F7F7F7F7F7F7F
+    highs = 0x8080808080808080
+    spread = byte * 0x0101010101010101
+    count = 0
+    chunked_length = len(data) - len(data) % 8
+
+    for index in range(0, chunked_length, 8):
+        chunk_end = index + 8
+        w = int.from_bytes(data[index:chunk_end], "little") ^ spread
+        count += 8 - ((((w & lows) + lows) | w) & highs).bit_count()
+
+    return count + data.count(byte, chunked_length)
+
+
+def part2_pure(data: bytes) -> int:
+    """An alternative `part2` built on the word-at-a-time counter above."""
+    data = data.strip()
+    newlines = _swar_count(data, ord("\n"))
+    return (
+        2 * (newlines + 1) + _swar_count(data, ord('"')) + _swar_count(data, ord("\\"))
+    )
+
+
+def part2_numpy(data: bytes) -> int:
+    """
+    The SWAR idea taken up one rung: NumPy's equality comparison and
+    `count_nonzero` reduction over a byte view run the same wide
+    compare-and-popcount loops (SSE2/AVX2 `cmpeq` plus mask counting) that
+    hand-written intrinsics would, 16 or 32 lanes at a time instead of
+    eight, without leaving Python.
+    """
+    buf = np.frombuffer(data.strip(), dtype=np.uint8)
+    newlines = int(np.count_nonzero(buf == ord("\n")))
+    escapable = int(np.count_nonzero(buf == ord('"')) + np.count_nonzero(buf == 0x5C))
+    return 2 * (newlines + 1) + escapable
+
+
+def _chunk_counts(chunk: bytes) -> tuple[int, int, int]:
+    """Run the fused counter over one chunk of whole lines."""
+    lines, shrinkage, escapable = _count_all(np.frombuffer(chunk, dtype=np.uint8))
+    return lines, shrinkage, escapable
+
+
+def count_all_parallel(data: bytes, workers: Optional[int] = None) -> tuple[int, int]:
+    """
+    `count_all` fanned out across worker processes, day 4 style. For a real
+    puzzle input this is overkill — the single pass finishes long before a
+    pool can spin up — but the counting is embarrassingly parallel across
+    lines, so the plumbing is here for corpus-sized inputs: hand each worker
+    a run of whole lines, count each run independently, and sum the
+    component triples. Chunks travel as plain bytes because worker
+    arguments have to be picklable.
+    """
+    workers = workers or os.cpu_count() or 1
+    lines = data.strip().split(b"\n")
+    chunk_size = -(-len(lines) // workers)  # ceiling division
+    chunks = []
+    for start in range(0, len(lines), chunk_size):
+        stop = start + chunk_size
+        chunks.append(b"\n".join(lines[start:stop]))
+
+    with ProcessPoolExecutor(workers) as pool:
+        counts = pool.map(_chunk_counts, chunks)
+
+    total_lines = total_shrinkage = total_escapable = 0
+    for chunk_lines, shrinkage, escapable in counts:
+        total_lines += chunk_lines
+        total_shrinkage += shrinkage
+        total_escapable += escapable
+
+    return 2 * total_lines + total_shrinkage, 2 * total_lines + total_escapable
 
 
 if __name__ == "__main__":
-    puzzle_input = open("input.txt").read()
+    # One binary read hands the counters bytes directly, with no decode to
+    # str and no line splitting in between.
+    with open("input.txt", "rb") as input_file:
+        puzzle_input = input_file.read()
+
+    # Running both parts separately would scan the input twice; the fused
+    # counter answers both from a single walk.
+    part1_answer, part2_answer = count_all(puzzle_input.strip())
 
     # Print out part 1 solution
-    print("Part 1:", part1(puzzle_input))
+    print("Part 1:", part1_answer)
 
     # Print out part 2 solution
-    print("Part 2:", part2(puzzle_input))
+    print("Part 2:", part2_answer)